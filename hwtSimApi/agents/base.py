@@ -20,9 +20,10 @@ class AgentBase():
     :ivar ~._enable: flag to enable/disable this agent
     :ivar ~._debugOutput: optional stream where to print debug messages
     """
-    # because otherwise there will be a cycle and python
-    # will not be able to deallocate this and sim/hwIO
-    __weakref__ = ["hwIO", "sim"]
+    # __dict__ is kept because agents replace driver/monitor/setEnable
+    # on the instance and subclasses may add their own attributes
+    __slots__ = ["hwIO", "_enabled", "_debugOutput", "sim",
+                 "__dict__", "__weakref__"]
 
     def __init__(self, sim: HdlSimulator, hwIO):
         self.hwIO = hwIO
@@ -44,14 +45,14 @@ class AgentBase():
         Called before simulation to collect all drivers of interfaces
         from this agent
         """
-        yield self.driver()
+        return (self.driver(),)
 
     def getMonitors(self):
         """
         Called before simulation to collect all monitors of interfaces
         from this agent
         """
-        yield self.monitor()
+        return (self.monitor(),)
 
     def driver(self):
         """
@@ -69,6 +70,7 @@ class AgentBase():
 
 
 class AgentWitReset(AgentBase):
+    __slots__ = ["rst", "rstOffIn"]
 
     def __init__(self, sim: HdlSimulator, hwIO, rst: Tuple["RtlSignal", bool]):
         """
@@ -78,6 +80,15 @@ class AgentWitReset(AgentBase):
         rst, rst_negated = rst
         self.rst = rst
         self.rstOffIn = int(rst_negated)
+        if type(self).notReset is AgentWitReset.notReset:
+            # specialize notReset for reset configuration as it is called
+            # on every clock edge by synchronous agents
+            if rst is None:
+                self.notReset = self._notReset_noRst
+            elif rst_negated:
+                self.notReset = self._notReset_rstNegated
+            else:
+                self.notReset = self._notReset_rst
 
     def notReset(self):
         if self.rst is None:
@@ -87,11 +98,21 @@ class AgentWitReset(AgentBase):
         rstVal = int(rstVal)
         return rstVal == self.rstOffIn
 
+    def _notReset_noRst(self):
+        return True
+
+    def _notReset_rst(self):
+        return not int(self.rst.read())
+
+    def _notReset_rstNegated(self):
+        return int(self.rst.read()) == 1
+
 
 class SyncAgentBase(AgentWitReset):
     """
     Agent which runs only monitor/driver function at specified edge of clk
     """
+    __slots__ = ["clk"]
     SELECTED_EDGE_CALLBACK = OnRisingCallbackLoop
 
     def __init__(self, sim: HdlSimulator,
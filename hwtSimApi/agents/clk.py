@@ -1,8 +1,10 @@
+from array import array
+
 from hwtSimApi.agents.base import AgentBase
 from hwtSimApi.constants import CLK_PERIOD
 from hwtSimApi.hdlSimulator import HdlSimulator
 from hwtSimApi.process_utils import CallbackLoop
-from hwtSimApi.triggers import Timer, WaitWriteOnly, WaitCombRead
+from hwtSimApi.triggers import Timer, WAIT_WRITE_ONLY, WAIT_COMB_READ
 
 
 class ClockAgent(AgentBase):
@@ -16,7 +18,11 @@ class ClockAgent(AgentBase):
 
     :ivar ~.period: period of signal to generate
     :ivar ~.initWait: time to wait before starting oscillation
+    :ivar ~._times: times of captured changes (monitor)
+    :ivar ~._values: values of captured changes, None is stored as -1 (monitor)
+    :ivar ~.data: list of tuples (time, nextVal) captured by monitor (see :meth:`~.data`)
     """
+    __slots__ = ["period", "initWait", "_times", "_values"]
 
     def __init__(self, sim: HdlSimulator, hwIO: "RtlSignal", period: int=CLK_PERIOD):
         super(ClockAgent, self).__init__(sim, hwIO)
@@ -29,52 +35,64 @@ class ClockAgent(AgentBase):
         assert isinstance(self.period, int)
         assert isinstance(self.initWait, int)
         sig = self.hwIO
-        yield WaitWriteOnly()
+        yield WAIT_WRITE_ONLY
         sig.write(0)
         yield Timer(self.initWait)
 
+        halfPeriod = Timer(self.period // 2)
+        v = 1
         while True:
-            halfPeriod = self.period // 2
-
-            yield Timer(halfPeriod)
-            yield WaitWriteOnly()
-            sig.write(1)
-
-            yield Timer(halfPeriod)
-            yield WaitWriteOnly()
-            sig.write(0)
+            yield halfPeriod
+            yield WAIT_WRITE_ONLY
+            sig.write(v)
+            v ^= 1
 
     def getMonitors(self):
-        self.last = (-1, None)
-        self.data = []
+        self._times = array("q")
+        self._values = array("b")
         return super(ClockAgent, self).getMonitors()
 
+    @property
+    def data(self):
+        """
+        :return: list of tuples (time, nextVal) captured by monitor
+        :attention: returned list is a snapshot, modifications of it do not affect the agent,
+            use assignment (e.g. ag.data = []) to clear or replace the captured data
+        """
+        return [(t, None if v < 0 else v)
+                for t, v in zip(self._times, self._values)]
+
+    @data.setter
+    def data(self, data):
+        self._times = array("q", (t for t, _ in data))
+        self._values = array("b", (-1 if v is None else v for _, v in data))
+
+    @property
+    def last(self):
+        """
+        :return: last tuple (time, nextVal) captured by monitor or (-1, None)
+        """
+        times = self._times
+        if not times:
+            return (-1, None)
+        v = self._values[-1]
+        return (times[-1], None if v < 0 else v)
+
     def monitor(self):
         assert isinstance(self.period, int)
         assert isinstance(self.initWait, int)
-        yield WaitCombRead()
+        yield WAIT_COMB_READ
         v = self.hwIO.read()
         try:
             v = int(v)
         except ValueError:
-            v = None
+            v = -1
 
         now = self.sim.now
-        last = self.last
-
-        _next = (now, v)
-        if last[0] == now:
-            if last[1] is not v:
-                # update last value
-                last = (now, v)
-                self.last = last
-                if self.data:
-                    self.data[-1] = last
-                else:
-                    self.data.append(last)
-            else:
-                return
+        times = self._times
+        if times and times[-1] == now:
+            # update last value
+            self._values[-1] = v
         else:
-            self.data.append(_next)
-
-        self.last = _next
+            times.append(now)
+            self._values.append(v)
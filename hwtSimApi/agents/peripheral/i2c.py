@@ -4,8 +4,8 @@ from typing import Tuple, Optional
 from hwtSimApi.agents.base import AgentWitReset, NOP, RX, TX
 from hwtSimApi.agents.peripheral.tristate import TristateAgent, TristateClkAgent,\
     TristateSignal
-from hwtSimApi.triggers import WaitCombStable, WaitWriteOnly, WaitCombRead,\
-    WaitTimeslotEnd
+from hwtSimApi.triggers import WAIT_COMB_STABLE, WAIT_WRITE_ONLY, WAIT_COMB_READ,\
+    WAIT_TIMESLOT_END
 from enum import Enum
 from hwtSimApi.hdlSimulator import HdlSimulator
 from hwtSimApi.process_utils import OnRisingCallbackLoop, OnFallingCallbackLoop
@@ -126,9 +126,9 @@ class I2cAgent(AgentWitReset):
     def _wait_until_command_completion(self):
         # wait untill command get processed
         while self.bit_cntrl:
-            yield WaitCombRead()
+            yield WAIT_COMB_READ
             if self.bit_cntrl:
-                yield WaitTimeslotEnd()
+                yield WAIT_TIMESLOT_END
 
     def execute_master_transaction(self):
         trans = self.data.pop()
@@ -237,23 +237,23 @@ class I2cAgent(AgentWitReset):
 
     def monitor(self):
         # now intf.sdc is rising
-        yield WaitCombRead()
+        yield WAIT_COMB_READ
         # wait on all agents to update values and on
         # simulator to apply them
         if self.sim.now > 0 and self.notReset():
             if self.bit_index != 8:
                 self.bit_index += 1
-                yield WaitCombStable()
+                yield WAIT_COMB_STABLE
                 v = self.sda.i.read()
                 self.bit_cntrl_rx.append(v)
             else:
-                yield WaitWriteOnly()
+                yield WAIT_WRITE_ONLY
                 self.sda._write(self.ACK)
 
     def driver(self):
         # now intf.sdc is rising
         # prepare data for next clk
-        yield WaitWriteOnly()
+        yield WAIT_WRITE_ONLY
         if self.bits:
             b = self.bits.popleft()
             if b == self.START:
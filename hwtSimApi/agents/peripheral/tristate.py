@@ -5,7 +5,7 @@ from hwtSimApi.agents.base import AgentWitReset, NOP
 from hwtSimApi.constants import CLK_PERIOD
 from hwtSimApi.hdlSimulator import HdlSimulator
 from hwtSimApi.simCalendar import DONE
-from hwtSimApi.triggers import Timer, WaitWriteOnly, WaitCombRead, Edge
+from hwtSimApi.triggers import Timer, WAIT_WRITE_ONLY, WAIT_COMB_READ, Edge
 
 
 class TristateSignal():
@@ -54,7 +54,7 @@ class TristateAgent(AgentWitReset):
         and optionaly store it.
         One step.
         """
-        yield WaitCombRead()
+        yield WAIT_COMB_READ
         # read in pre-clock-edge
         t = self.t.read()
         o = self.o.read()
@@ -81,17 +81,11 @@ class TristateAgent(AgentWitReset):
         else:
             v = self.pullMode
 
-        last = self.i.read()
-        try:
-            last = int(last)
-        except ValueError:
-            last = None
-
-        yield WaitWriteOnly()
+        yield WAIT_WRITE_ONLY
         self.i.write(v)
 
         if self.collectData and sim.now > 0:
-            yield WaitCombRead()
+            yield WAIT_COMB_READ
             if self.notReset():
                 self.data.append(v)
 
@@ -138,7 +132,7 @@ class TristateAgent(AgentWitReset):
         One step if not selfSynchronization else infinite loop.
         """
         while True:
-            yield WaitWriteOnly()
+            yield WAIT_WRITE_ONLY
             if self.data:
                 o = self.data.popleft()
                 if o == NOP:
@@ -172,15 +166,15 @@ class TristateClkAgent(TristateAgent):
         low = not self.pullMode
         halfPeriod = self.period // 2
 
-        yield WaitWriteOnly()
+        yield WAIT_WRITE_ONLY
         o.write(low)
         self.t.write(1)
 
         while True:
             yield Timer(halfPeriod)
-            yield WaitWriteOnly()
+            yield WAIT_WRITE_ONLY
             o.write(high)
 
             yield Timer(halfPeriod)
-            yield WaitWriteOnly()
+            yield WAIT_WRITE_ONLY
             o.write(low)
@@ -10,7 +10,7 @@ from typing import Tuple
 from hwtSimApi.agents.base import AgentBase
 from hwtSimApi.constants import Time
 from hwtSimApi.hdlSimulator import HdlSimulator
-from hwtSimApi.triggers import Timer, WaitTimeslotEnd
+from hwtSimApi.triggers import Timer, WAIT_TIMESLOT_END, Event
 
 # constants for most common baud rates
 BAUD_9600 = 9600
@@ -24,20 +24,46 @@ BAUD_DEFAULT = BAUD_115200
 
 class UartDataAgent(AgentBase):
     """
-    :ivar ~.char_buff: the buffer used for bits while sending the character
+    :ivar ~.data: deque of characters to send (driver) or received characters (monitor)
+    :ivar ~._enable_event: Event with processes sleeping until this agent is enabled
     """
+    __slots__ = ["bit_period", "_half_period", "_period", "data", "_enable_event"]
     START_BIT = 0
     STOP_BIT = 1
 
     def __init__(self, sim: HdlSimulator, hwIO: "RtlSignal", baud: int):
         super(UartDataAgent, self).__init__(sim, hwIO)
-        self.set_baud(self, baud)
-        self.char_buff = []
+        self.set_baud(baud)
         self.data = deque()
+        self._enable_event = None
 
     def set_baud(self, baud: int):
         self.bit_period = Time.s // baud
         assert self.bit_period > 2, baud
+        # timers are stateless and can be shared between processes
+        self._half_period = Timer(self.bit_period // 2)
+        self._period = Timer(self.bit_period)
+
+    def setEnable(self, en):
+        super(UartDataAgent, self).setEnable(en)
+        ev = self._enable_event
+        if en and ev is not None:
+            # wake up processes which were waiting for enable
+            # (woken on the next bit period, same as a Timer)
+            self._enable_event = None
+            sim = self.sim
+            t = sim.now + self.bit_period
+            for p in ev:
+                sim._schedule_proc(t, p)
+
+    def _waitEnabled(self):
+        """
+        :return: Event which wakes the process (bit period) after setEnable(True)
+        """
+        ev = self._enable_event
+        if ev is None:
+            ev = self._enable_event = Event("UartDataAgent enable")
+        return ev
 
     def recieve_text(self) -> str:
         """
@@ -50,8 +76,8 @@ class UartDataAgent(AgentBase):
         """
 
     def monitor(self):
-        half_period = Timer(self.bit_period // 2)
-        period = Timer(self.bit_period)
+        half_period = self._half_period
+        period = self._period
         hwIO = self.hwIO
 
         yield half_period
@@ -59,43 +85,45 @@ class UartDataAgent(AgentBase):
         while True:
             while True:
                 if not self.getEnable():
-                    yield period
+                    yield self._waitEnabled()
                     continue
 
-                yield WaitTimeslotEnd()
+                yield WAIT_TIMESLOT_END
                 d = hwIO.read()
                 if int(d) == self.START_BIT:
                     break
                 else:
                     yield half_period
 
+            # bits are received LSB first
+            ch = 0
             for _ in range(8):
                 yield period
-                yield WaitTimeslotEnd()
-                d = hwIO.read()
-                self.char_buff.append(d)
+                yield WAIT_TIMESLOT_END
+                d = int(hwIO.read())
+                ch = (ch >> 1) | ((d & 0b1) << 7)
 
-            d = int(d)
+            yield period
+            yield WAIT_TIMESLOT_END
+            d = int(hwIO.read())
             if d == self.STOP_BIT:
                 # correctly received char
-                self.char_buff.clear()
-                ch = 0
-                for b in reversed(self.char_buff):
-                    ch <<= 1
-                    ch |= int(b)
+                self.data.append(ch)
                 yield period
             else:
                 # received data is in wrong format, discard it
-                self.char_buff.clear()
                 yield half_period
 
     def driver(self):
-        half_period = Timer(self.bit_period // 2)
-        period = Timer(self.bit_period)
+        half_period = self._half_period
+        period = self._period
         hwIO = self.hwIO
         yield half_period
         while True:
-            if self.getEnable() and self.data:
+            if not self.getEnable():
+                # sleep instead of polling on every bit period
+                yield self._waitEnabled()
+            elif self.data:
                 ch = self.data.popleft()
                 hwIO.write(self.START_BIT)
                 yield period
@@ -103,25 +131,26 @@ class UartDataAgent(AgentBase):
                     hwIO.write((ch >> i) & 0b1)
                     yield period
                 hwIO.write(self.STOP_BIT)
-            yield period
+                yield period
+            else:
+                yield period
 
 
 class UartRxTxAgent(AgentBase):
+    __slots__ = ["rx", "tx"]
 
-    def __init__(self, hwIO: Tuple["RtlSignal", "RtlSignal"], baud: int):
-        super(UartRxTxAgent, self).__init__(hwIO)
+    def __init__(self, sim: HdlSimulator, hwIO: Tuple["RtlSignal", "RtlSignal"], baud: int):
+        super(UartRxTxAgent, self).__init__(sim, hwIO)
         rx, tx = hwIO
-        self.rx = UartDataAgent(rx, baud)
-        self.tx = UartDataAgent(tx, baud)
+        self.rx = UartDataAgent(sim, rx, baud)
+        self.tx = UartDataAgent(sim, tx, baud)
 
     def set_baud(self, baud: int):
         self.rx.set_baud(baud)
         self.tx.set_baud(baud)
 
     def getDrivers(self):
-        yield from self.rx.getMonitors()
-        yield from self.tx.getDrivers()
+        return self.rx.getMonitors() + self.tx.getDrivers()
 
     def getMonitors(self):
-        yield from self.rx.getDrivers()
-        yield from self.tx.getMonitors()
+        return self.rx.getDrivers() + self.tx.getMonitors()
@@ -4,9 +4,12 @@ from typing import Tuple
 from hwtSimApi.agents.base import NOP, SyncAgentBase
 from hwtSimApi.hdlSimulator import HdlSimulator
 from hwtSimApi.process_utils import OnRisingCallbackLoop, OnFallingCallbackLoop
-from hwtSimApi.triggers import WaitCombStable, WaitWriteOnly, WaitCombRead, \
+from hwtSimApi.triggers import WAIT_COMB_STABLE, WAIT_WRITE_ONLY, WAIT_COMB_READ, \
     Timer
 
+# types of data items which can not have onDone callback
+_DATA_T_WITHOUT_ON_DONE = frozenset((int, bool, str, bytes, tuple, list, type(None)))
+
 
 class DataRdVldAgent(SyncAgentBase):
     """
@@ -19,7 +22,16 @@ class DataRdVldAgent(SyncAgentBase):
 
     :ivar presetBeforeClk: if this is driver set data and vld 1/4 clk period before clk tick (clk frequency must remain the same)
         (this is a debug feature which allows user to see what happens on clk tick better)
+    :ivar ~.data: deque of data to send (driver) or received data (monitor),
+        use data.extend() to add multiple items at once
+    :ivar ~.onMonitorReady: optional callback executed in monitor before ready is set for a new data
+    :ivar ~.onDriverWriteAck: optional callback executed in driver after data was accepted by slave
     """
+    __slots__ = ["presetBeforeClk", "actualData", "data",
+                 "_lastWritten", "_lastRd", "_lastVld", "_readyComnsummed",
+                 "_afterRead"]
+    onMonitorReady = None
+    onDriverWriteAck = None
 
     def __init__(self, sim: HdlSimulator, hwIO,
                  clk: "RtlSignal",
@@ -95,19 +107,19 @@ class DataRdVldAgent(SyncAgentBase):
         If onMonitorReady is present run it before setting ready and before data is read from the channel
         """
         start = self.sim.now
-        yield WaitCombRead()
+        yield WAIT_COMB_READ
         if not self._enabled:
             return
 
         if self.notReset():
-            yield WaitWriteOnly()
+            yield WAIT_WRITE_ONLY
             if not self._enabled:
                 return
 
             if self._readyComnsummed:
                 # try to run onMonitorReady if there is any to preset value on signals potentially
                 # going against main data flow of this channel
-                onMonitorReady = getattr(self, "onMonitorReady", None)
+                onMonitorReady = self.onMonitorReady
                 if onMonitorReady is not None:
                     onMonitorReady()
                 self._readyComnsummed = False
@@ -117,7 +129,7 @@ class DataRdVldAgent(SyncAgentBase):
                 self.set_ready(1)
                 self._lastRd = 1
             else:
-                yield WaitCombRead()
+                yield WAIT_COMB_READ
                 assert int(self.get_ready()) == self._lastRd, (
                     "Something changed the value of ready without notifying this agent"
                     " which is responsible for this",
@@ -127,7 +139,7 @@ class DataRdVldAgent(SyncAgentBase):
                 return
 
             # wait for response of master
-            yield WaitCombStable()
+            yield WAIT_COMB_STABLE
             if not self._enabled:
                 return
             vld = self.get_valid()
@@ -154,7 +166,7 @@ class DataRdVldAgent(SyncAgentBase):
         else:
             self._readyComnsummed = True
             if self._lastRd != 0:
-                yield WaitWriteOnly()
+                yield WAIT_WRITE_ONLY
                 # can not receive, say it to masters
                 self.set_ready(0)
                 self._lastRd = 0
@@ -164,7 +176,7 @@ class DataRdVldAgent(SyncAgentBase):
         assert start == self.sim.now
 
     def checkIfRdWillBeValid(self):
-        yield WaitCombStable()
+        yield WAIT_COMB_STABLE
         rd = self.get_ready()
         try:
             rd = int(rd)
@@ -172,7 +184,6 @@ class DataRdVldAgent(SyncAgentBase):
             raise AssertionError(self.sim.now, self.hwIO, "rd signal in invalid state")
 
     def _driverPreSetPriodically(self):
-        sim = self.sim
         c = self.SELECTED_EDGE_CALLBACK
         period = self.clk._ag.period
 
@@ -183,22 +194,36 @@ class DataRdVldAgent(SyncAgentBase):
         else:
             raise NotImplementedError(c)
 
+        period = Timer(period)
         while True:
-            yield WaitWriteOnly()
-            sim._schedule_proc(sim.now, self.driverPreSet())
-            yield Timer(period)
+            yield WAIT_WRITE_ONLY
+            # yielded generator is scheduled in actual time slot
+            yield self.driverPreSet()
+            yield period
 
     def getDrivers(self):
         if self.presetBeforeClk:
-            yield self._driverPreSetPriodically()
+            preset = (self._driverPreSetPriodically(),)
             self.driver = self.driverMarkDataSendOnClkTick
-        yield from SyncAgentBase.getDrivers(self)
+        else:
+            preset = ()
+            cls = self.__class__
+            # use fused driver only if driver is still the default one
+            # (not set on instance, not wrapped by previous call of getDrivers)
+            if "driver" not in self.__dict__\
+                    and cls.driver is DataRdVldAgent.driver\
+                    and cls.driverPreSet is DataRdVldAgent.driverPreSet\
+                    and cls.driverMarkDataSendOnClkTick is DataRdVldAgent.driverMarkDataSendOnClkTick:
+                self.driver = self._driverFused
+        return preset + SyncAgentBase.getDrivers(self)
  
     def driverPreSet(self):
         """
         Set actual data and vld signal.
+
+        :attention: :meth:`~._driverFused` contains a copy of this code, keep it in sync
         """
-        yield WaitWriteOnly()
+        yield WAIT_WRITE_ONLY
         if not self._enabled:
             return
         # pop new data if there are not any pending
@@ -221,19 +246,21 @@ class DataRdVldAgent(SyncAgentBase):
             self.set_data(data)
             self._lastWritten = self.actualData
 
-        yield WaitCombRead()
+        yield WAIT_COMB_READ
         if not self._enabled:
             return
         en = self.notReset()
         vld = int(en and doSend)
         if self._lastVld is not vld:
-            yield WaitWriteOnly()
+            yield WAIT_WRITE_ONLY
             self.set_valid(vld)
             self._lastVld = vld
 
     def driverMarkDataSendOnClkTick(self):
         """
         Resolve monitor rd signal and if it was 1 pop next data
+
+        :attention: :meth:`~._driverFused` contains a copy of this code, keep it in sync
         """
         start = self.sim.now
         if not self._enabled:
@@ -243,7 +270,7 @@ class DataRdVldAgent(SyncAgentBase):
             return
 
         # wait for response of slave
-        yield WaitCombStable()
+        yield WAIT_COMB_STABLE
         if not self._enabled:
             return
         rd = self.get_ready()
@@ -272,13 +299,14 @@ class DataRdVldAgent(SyncAgentBase):
                 self.actualData = NOP
 
             # try to run onDriverWriteAck if there is any
-            onDriverWriteAck = getattr(self, "onDriverWriteAck", None)
+            onDriverWriteAck = self.onDriverWriteAck
             if onDriverWriteAck is not None:
                 onDriverWriteAck()
 
-            onDone = getattr(a, "onDone", None)
-            if onDone is not None:
-                onDone()
+            if a.__class__ not in _DATA_T_WITHOUT_ON_DONE:
+                onDone = getattr(a, "onDone", None)
+                if onDone is not None:
+                    onDone()
 
     def driver(self):
         """
@@ -290,3 +318,92 @@ class DataRdVldAgent(SyncAgentBase):
         yield from self.driverPreSet()
         yield from self.driverMarkDataSendOnClkTick()
         assert start == self.sim.now
+
+    def _driverFused(self):
+        """
+        :meth:`~.driver` with inlined :meth:`~.driverPreSet`
+        and :meth:`~.driverMarkDataSendOnClkTick`
+        (to avoid nested generators on every clock tick)
+
+        :attention: has to be kept in sync with driverPreSet and driverMarkDataSendOnClkTick
+        """
+        start = self.sim.now
+        # driverPreSet
+        yield WAIT_WRITE_ONLY
+        if self._enabled:
+            # pop new data if there are not any pending
+            if self.actualData is NOP and self.data:
+                self.actualData = self.data.popleft()
+
+            doSend = self.actualData is not NOP
+
+            # update data on signals if it is required
+            if self.actualData is not self._lastWritten:
+                if doSend:
+                    data = self.actualData
+                else:
+                    data = None
+                    if self._lastVld:
+                        # forward set valid=0 to prevent spike right before clock edge
+                        self.set_valid(0)
+                        self._lastVld = 0
+
+                self.set_data(data)
+                self._lastWritten = self.actualData
+
+            yield WAIT_COMB_READ
+            if self._enabled:
+                en = self.notReset()
+                vld = int(en and doSend)
+                if self._lastVld is not vld:
+                    yield WAIT_WRITE_ONLY
+                    self.set_valid(vld)
+                    self._lastVld = vld
+
+        # driverMarkDataSendOnClkTick
+        if not self._enabled:
+            # we can not check rd it in this function because we can not wait
+            # because we can be reactivated in this same time
+            yield self.checkIfRdWillBeValid()
+            return
+
+        # wait for response of slave
+        yield WAIT_COMB_STABLE
+        if not self._enabled:
+            return
+        rd = self.get_ready()
+        try:
+            rd = int(rd)
+        except ValueError:
+            raise AssertionError(
+                self.sim.now, self.hwIO,
+                "rd signal in invalid state") from None
+
+        if not self._lastVld:
+            assert start == self.sim.now
+            return
+
+        if rd:
+            # slave did read data, take new one
+            if self._debugOutput is not None:
+                name = self.hwIO._getFullName()
+                self._debugOutput.write(f"{name:s}, wrote, {self.sim.now:d}: {self.actualData}\n")
+
+            a = self.actualData
+            # pop new data, because actual was read by slave
+            if self.data:
+                self.actualData = self.data.popleft()
+            else:
+                self.actualData = NOP
+
+            # try to run onDriverWriteAck if there is any
+            onDriverWriteAck = self.onDriverWriteAck
+            if onDriverWriteAck is not None:
+                onDriverWriteAck()
+
+            if a.__class__ not in _DATA_T_WITHOUT_ON_DONE:
+                onDone = getattr(a, "onDone", None)
+                if onDone is not None:
+                    onDone()
+
+        assert start == self.sim.now
@@ -71,13 +71,16 @@ Pitfalls of delta-step based HDL simulators
               values can be undefined and read only access is required.
 """
 
-from inspect import isgenerator
+from types import GeneratorType
 from typing import List
 
 from hwtSimApi.simCalendar import SimTimeSlot, SimCalendar, DONE
 from hwtSimApi.triggers import Event, raise_StopSimulation, \
     StopSimumulation, Action
 
+# max number of finished time slots kept for reuse
+SLOT_POOL_SIZE = 1024
+
 
 # similar to https://github.com/potentialventures/cocotb/blob/master/cocotb/scheduler.py
 class HdlSimulator():
@@ -89,6 +92,7 @@ class HdlSimulator():
     :ivar ~.now: actual simulation time
     :ivar ~._events: heap of simulation events and processes
     :ivar ~.rtl_simulator: circuit simulator used for simulation of circuit itself
+    :ivar ~._slot_pool: finished time slots which can be reused for new time slots
     """
 
     def __init__(self, rtl_simulator):
@@ -97,6 +101,7 @@ class HdlSimulator():
         self._events = SimCalendar()
         self._current_time_slot = None  # type: SimTimeSlot
         self._current_event_list = None  # type: List
+        self._slot_pool = []  # type: List[SimTimeSlot]
 
         schedule = self._events.push
 
@@ -107,6 +112,15 @@ class HdlSimulator():
         #
         self.schedule = schedule
 
+    def _new_slot(self) -> SimTimeSlot:
+        """
+        :return: empty time slot, recycled if possible
+        """
+        pool = self._slot_pool
+        if pool:
+            return pool.pop()
+        return SimTimeSlot()
+
     def _run_process(self, process):
         """
         Execute process and process it's requests
@@ -120,10 +134,11 @@ class HdlSimulator():
             elif isinstance(ev, Event):
                 ev.applyProcess(self, process)
                 break
-            elif isgenerator(ev):
+            elif isinstance(ev, GeneratorType):
                 # else this process spotted new process
                 # and it has to be put in queue
-                self._schedule_proc_now(ev)
+                # (inlined _schedule_proc_now, the type is already checked)
+                self._current_event_list.append(ev)
             else:
                 raise ValueError(ev)
 
@@ -137,11 +152,13 @@ class HdlSimulator():
             # proper solution is to put triggered events to sim.
             # calendar with urgent priority  but we evaluate
             # it directly because of performance
+            _run_process = self._run_process
             for _process in rtl_pending_event_list:
-                if not isgenerator(_process):
+                if not isinstance(_process, GeneratorType):
                     _process = _process(self)
 
-                self._run_process(_process)
+                _run_process(_process)
+            # the list is owned by RTL simulator, it has to be cleared in place
             rtl_pending_event_list.clear()
 
     def _run_event_list(self, events):
@@ -153,14 +170,14 @@ class HdlSimulator():
             for ev in events:
                 # process is Python generator or Event
                 if isinstance(ev, Event):
-                    for p in ev:
+                    for p in ev.process_to_wake:
                         self._run_process(p)
                 else:
                     self._run_process(ev)
 
         self._current_event_list = None
 
-    def run(self, until: int, extraProcesses=[]) -> None:
+    def run(self, until: int, extraProcesses=()) -> None:
         """
         Run simulation for a specified time
 
@@ -173,22 +190,26 @@ class HdlSimulator():
             return
 
         now = self.now
-        time_slot = SimTimeSlot()
-        time_slot.write_only = []
-        for proc in extraProcesses:
-            assert isgenerator(proc), proc
-            time_slot.write_only.append(proc)
+        time_slot = self._new_slot()
+        time_slot.write_only = write_only = list(extraProcesses)
+        assert all(isinstance(proc, GeneratorType) for proc in write_only), write_only
         # add handle to stop simulation
         self.schedule(now, time_slot)
 
-        end_time_slot = SimTimeSlot()
+        end_time_slot = self._new_slot()
         end_time_slot.write_only = [raise_StopSimulation(self), ]
         self.schedule(now + until, end_time_slot)
 
         next_time_slot = self._events.pop
         rtl_sim = self.rtl_simulator
         _run_event_list = self._run_event_list
+        _eval_rtl_events = self._eval_rtl_events
+        rtl_eval = rtl_sim.eval
+        rtl_reset_eval = rtl_sim.reset_eval
+        rtl_set_write_only = rtl_sim.set_write_only
+        COMB_UPDATE_DONE = rtl_sim.COMB_UPDATE_DONE
         END = rtl_sim.END_OF_STEP
+        slot_pool = self._slot_pool
         try:
             # for all events
             while True:
@@ -198,30 +219,37 @@ class HdlSimulator():
                 rtl_sim.time = self.now = now
 
                 # run preinitialization of sim. environment
-                _run_event_list(time_slot.timeslot_begin)
+                # (phases without any process are skipped without a call)
+                events = time_slot.timeslot_begin
+                if events is not None:
+                    _run_event_list(events)
                 time_slot.timeslot_begin = DONE
 
                 # run resolution of combinational lopps
                 first_run = True
                 while first_run or time_slot.write_only:
-                    _run_event_list(time_slot.write_only)
+                    events = time_slot.write_only
+                    if events is not None:
+                        _run_event_list(events)
                     time_slot.write_only = None
-                    s = rtl_sim.eval()
+                    s = rtl_eval()
 
-                    assert s == rtl_sim.COMB_UPDATE_DONE, (self.now, s)
-                    if time_slot.comb_read is None:
-                        self._current_event_list = time_slot.comb_read = []
-                    else:
-                        self._current_event_list = time_slot.comb_read
-                    self._eval_rtl_events()
+                    assert s == COMB_UPDATE_DONE, (now, s)
+                    comb_read = time_slot.comb_read
+                    if rtl_sim.pending_event_list:
+                        if comb_read is None:
+                            comb_read = time_slot.comb_read = []
+                        self._current_event_list = comb_read
+                        _eval_rtl_events()
 
-                    _run_event_list(time_slot.comb_read)
+                    if comb_read is not None:
+                        _run_event_list(comb_read)
                     time_slot.comb_read = None
 
-                    if time_slot.write_only is not None:
+                    if time_slot.write_only:
                         # we have to reevaluate the combinational logic
                         # if write in this time stamp is required
-                        rtl_sim.reset_eval()
+                        rtl_reset_eval()
                     first_run = False
 
                 time_slot.write_only = DONE
@@ -229,33 +257,44 @@ class HdlSimulator():
 
                 # run evaluation of rest of the circuit
                 while not rtl_sim.read_only_not_write_only:
-                    rtl_sim.eval()
+                    rtl_eval()
                     if rtl_sim.pending_event_list:
-                        if time_slot.comb_read is None:
-                            self._current_event_list = time_slot.comb_stable = []
-                        else:
-                            self._current_event_list = time_slot.comb_stable
-                        self._eval_rtl_events()
-
-                _run_event_list(time_slot.comb_stable)
+                        comb_stable = time_slot.comb_stable
+                        if comb_stable is None:
+                            comb_stable = time_slot.comb_stable = []
+                        self._current_event_list = comb_stable
+                        _eval_rtl_events()
+
+                events = time_slot.comb_stable
+                if events is not None:
+                    _run_event_list(events)
                 time_slot.comb_stable = DONE
 
                 while True:
-                    ret = rtl_sim.eval()
+                    ret = rtl_eval()
                     if rtl_sim.pending_event_list:
-                        if time_slot.mem_stable is None:
-                            self._current_event_list = time_slot.mem_stable = []
-                        else:
-                            self._current_event_list = time_slot.mem_stable
-                        self._eval_rtl_events()
+                        mem_stable = time_slot.mem_stable
+                        if mem_stable is None:
+                            mem_stable = time_slot.mem_stable = []
+                        self._current_event_list = mem_stable
+                        _eval_rtl_events()
                     if ret == END:
                         break
-                _run_event_list(time_slot.mem_stable)
+                events = time_slot.mem_stable
+                if events is not None:
+                    _run_event_list(events)
                 time_slot.mem_stable = DONE
 
-                _run_event_list(time_slot.timeslot_end)
+                events = time_slot.timeslot_end
+                if events is not None:
+                    _run_event_list(events)
                 time_slot.timeslot_end = DONE
-                rtl_sim.set_write_only()
+                rtl_set_write_only()
+
+                # the time slot is finished and can be reused for a later time
+                if len(slot_pool) < SLOT_POOL_SIZE:
+                    time_slot.reset()
+                    slot_pool.append(time_slot)
 
         except StopSimumulation:
             pass
@@ -265,17 +304,19 @@ class HdlSimulator():
         rtl_sim.read_only_not_write_only = True
 
     def _schedule_proc_now(self, ev):
-        assert isinstance(ev, (Action, Event)) or isgenerator(ev), ev
+        assert isinstance(ev, (Action, Event, GeneratorType)), ev
         self._current_event_list.append(ev)
 
     def _schedule_proc(self, time: int, ev) -> None:
-        assert isinstance(ev, (Action, Event)) or isgenerator(ev), ev
+        assert isinstance(ev, (Action, Event, GeneratorType)), ev
         if self.now == time:
             self._current_event_list.append(ev)
         else:
-            ts = self._events.get(time, None)
+            ts = self._events.get(time)
             if ts is None:
-                ts = SimTimeSlot()
+                # inlined _new_slot
+                pool = self._slot_pool
+                ts = pool.pop() if pool else SimTimeSlot()
                 self.schedule(time, ts)
             if ts.write_only is None:
                 ts.write_only = []
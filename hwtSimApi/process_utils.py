@@ -2,7 +2,7 @@ from inspect import isgeneratorfunction
 from typing import Callable, Generator, Union
 
 from hwtSimApi.hdlSimulator import HdlSimulator
-from hwtSimApi.triggers import Edge, WaitCombRead
+from hwtSimApi.triggers import Edge, WAIT_COMB_READ
 
 
 class ExitCallbackLoop(StopIteration):
@@ -90,7 +90,7 @@ class OnRisingCallbackLoop(CallbackLoop):
                 while True:
                     yield Edge(sig)
                     if self._enable and self.shouldBeEnabledFn():
-                        yield WaitCombRead()
+                        yield WAIT_COMB_READ
                         if sig_read():
                             yield from fn()
             else:
@@ -100,7 +100,7 @@ class OnRisingCallbackLoop(CallbackLoop):
                 while True:
                     yield Edge(sig)
                     if self._enable and self.shouldBeEnabledFn():
-                        yield WaitCombRead()
+                        yield WAIT_COMB_READ
                         if sig_read():
                             fn()
 
@@ -126,7 +126,7 @@ class OnFallingCallbackLoop(CallbackLoop):
                 while True:
                     yield Edge(sig)
                     if self._enable and self.shouldBeEnabledFn():
-                        yield WaitCombRead()
+                        yield WAIT_COMB_READ
                         if not sig_read():
                             yield from fn()
             else:
@@ -136,7 +136,7 @@ class OnFallingCallbackLoop(CallbackLoop):
                 while True:
                     yield Edge(sig)
                     if self._enable and self.shouldBeEnabledFn():
-                        yield WaitCombRead()
+                        yield WAIT_COMB_READ
                         if not sig_read():
                             fn()
 
@@ -1,4 +1,4 @@
-from sortedcontainers.sorteddict import SortedDict
+from heapq import heappush, heappop
 from typing import Tuple
 
 
@@ -31,6 +31,17 @@ class SimTimeSlot():
         self.mem_stable = None
         self.timeslot_end = None
 
+    def reset(self):
+        """
+        Clear all phases so the object can be reused for a new time slot
+        """
+        self.timeslot_begin = None
+        self.write_only = None
+        self.comb_read = None
+        self.comb_stable = None
+        self.mem_stable = None
+        self.timeslot_end = None
+
     def get_state_name(self):
         if self.timeslot_begin is not DONE:
             return "timeslot_begin"
@@ -51,14 +62,38 @@ class SimTimeSlot():
 
 
 # internal
-class SimCalendar(SortedDict):
+class SimCalendar():
     """
     Priority queue where key is time
+
+    :ivar ~._heap: binary heap of times of scheduled time slots
+    :ivar ~._map: dictionary time -> time slot for lookup of scheduled time slots
+    :ivar ~.get: get(time, default=None) -> time slot scheduled for time or default
+        (dict.get of _map bound directly to avoid a Python level call)
     """
+    __slots__ = ["_heap", "_map", "get"]
+
+    def __init__(self):
+        self._heap = []
+        self._map = {}
+        self.get = self._map.get
 
     def push(self, time: int, value: SimTimeSlot):
         assert isinstance(time, int), time.__class__
-        super(SimCalendar, self).__setitem__(time, value)
+        m = self._map
+        if time not in m:
+            heappush(self._heap, time)
+        m[time] = value
+
+    def pop(self) -> Tuple[int, SimTimeSlot]:
+        t = heappop(self._heap)
+        return t, self._map.pop(t)
+
+    def __getitem__(self, time: int) -> SimTimeSlot:
+        return self._map[time]
+
+    def __contains__(self, time: int) -> bool:
+        return time in self._map
 
-    def pop(self) -> Tuple[int, object]:
-        return super(SimCalendar, self).popitem(0)
+    def __len__(self):
+        return len(self._heap)
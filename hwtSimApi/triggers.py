@@ -9,6 +9,7 @@ class Event():
 
     :param process_to_wake: list of sim. processes (generator instances)
         to wake when this event is triggered
+    :note: process_to_wake is a plain list and the simulator iterates it directly
     """
     __slots__ = ["debug_name", "process_to_wake"]
 
@@ -158,3 +159,10 @@ class WaitTimeslotEnd(Action):
             ev_list = sim._current_event_list
         ev_list.append(process)
         return False
+
+
+# triggers without state, shared instances to avoid allocation on every yield
+WAIT_WRITE_ONLY = WaitWriteOnly()
+WAIT_COMB_READ = WaitCombRead()
+WAIT_COMB_STABLE = WaitCombStable()
+WAIT_TIMESLOT_END = WaitTimeslotEnd()
@@ -4,8 +4,15 @@ from hwtSimApi.constants import Time
 
 
 def freq_to_period(f: Union[float, int]):
+    """
+    :return: period in simulation time units, int if it is representable exactly
+    """
+    if isinstance(f, int):
+        t, rem = divmod(Time.s, f)
+        if not rem:
+            return t
     return Time.s / f
 
 
 def period_to_freq(t: Union[float, int]):
-    return Time.s / float(t)
+    return Time.s / t